@@ -23,7 +23,7 @@ from mysql.connector import MySQLConnection, errorcode
 from mysql.connector.connection_cext import CMySQLConnection
 from mysql.connector.pooling import PooledMySQLConnection
 from requests import HTTPError
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, inspect
 from sqlalchemy.engine import Engine
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
@@ -187,6 +187,13 @@ def sqlite_database(pytestconfig: Config, _session_faker: Faker, tmpdir_factory:
     return str(db_file)
 
 
+@pytest.fixture(scope="session")
+def sqlite_table_names(sqlite_database: str) -> t.Iterator[t.List[str]]:
+    engine: Engine = create_engine(f"sqlite:///{sqlite_database}")
+    yield inspect(engine).get_table_names()
+    engine.dispose()
+
+
 def is_port_in_use(port: int, host: str = "0.0.0.0") -> bool:
     with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
         return s.connect_ex((host, port)) == 0
@@ -286,35 +293,38 @@ def mysql_instance(mysql_credentials: MySQLCredentials, pytestconfig: Config) ->
             auto_remove=True,
         )
 
-    while not mysql_available and mysql_connection_retries > 0:
-        try:
-            mysql_connection = mysql.connector.connect(
-                user=mysql_credentials.user,
-                password=mysql_credentials.password,
-                host=mysql_credentials.host,
-                port=mysql_credentials.port,
-                charset="utf8mb4",
-                collation="utf8mb4_unicode_ci",
-            )
-        except mysql.connector.Error as err:
-            if err.errno == errorcode.CR_SERVER_LOST:
-                # sleep for two seconds and retry the connection
-                sleep(2)
-            else:
-                raise
-        finally:
-            mysql_connection_retries -= 1
-            if mysql_connection and mysql_connection.is_connected():
-                mysql_available = True
-                mysql_connection.close()
-    else:
-        if not mysql_available and mysql_connection_retries <= 0:
-            raise ConnectionAbortedError("Maximum MySQL connection retries exhausted! Are you sure MySQL is running?")
-
-    yield  # type: ignore[misc]
+    try:
+        while not mysql_available and mysql_connection_retries > 0:
+            try:
+                mysql_connection = mysql.connector.connect(
+                    user=mysql_credentials.user,
+                    password=mysql_credentials.password,
+                    host=mysql_credentials.host,
+                    port=mysql_credentials.port,
+                    charset="utf8mb4",
+                    collation="utf8mb4_unicode_ci",
+                )
+            except mysql.connector.Error as err:
+                if err.errno == errorcode.CR_SERVER_LOST:
+                    # sleep for two seconds and retry the connection
+                    sleep(2)
+                else:
+                    raise
+            finally:
+                mysql_connection_retries -= 1
+                if mysql_connection and mysql_connection.is_connected():
+                    mysql_available = True
+                    mysql_connection.close()
+        else:
+            if not mysql_available and mysql_connection_retries <= 0:
+                raise ConnectionAbortedError(
+                    "Maximum MySQL connection retries exhausted! Are you sure MySQL is running?"
+                )
 
-    if use_docker and container is not None:
-        container.kill()
+        yield  # type: ignore[misc]
+    finally:
+        if use_docker and container is not None:
+            container.kill()
 
 
 @pytest.fixture()
@@ -1,10 +1,10 @@
 import logging
 import re
 import typing as t
-from random import choice
 
 import mysql.connector
 import pytest
+from _pytest.fixtures import FixtureRequest
 from _pytest.logging import LogCaptureFixture
 from faker import Faker
 from mysql.connector import errorcode
@@ -16,110 +16,135 @@ from sqlite3_to_mysql import SQLite3toMySQL
 from tests.conftest import MySQLCredentials
 
 
+_DIGITS_RE: t.Pattern[str] = re.compile(r"\d+")
+_SKIPPED_COLUMN_TYPES: t.Set[str] = {"Insert", "insert", "dialect"}
+_TRANSLATED_COLUMN_TYPES: t.Set[str] = {"VARCHAR", "INTEGER", "INT64", "NUMERIC", "TEXT", "BOOL", "BOOLEAN"}
+_FIXED_COLUMN_TYPES: t.Tuple[str, ...] = tuple(
+    column for column in sqlite_column_types if column not in _SKIPPED_COLUMN_TYPES | _TRANSLATED_COLUMN_TYPES
+)
+
+
+class FakeCursor:
+    def execute(self, statement: t.Any) -> None:
+        raise mysql.connector.Error(msg="Unknown MySQL error", errno=errorcode.CR_UNKNOWN_ERROR)
+
+
+def _fake_transfer_table_data(sql: str, total_records: int = 0) -> None:
+    raise mysql.connector.Error(msg="Unknown MySQL error", errno=errorcode.CR_UNKNOWN_ERROR)
+
+
+@pytest.fixture
+def quiet() -> bool:
+    return False
+
+
+@pytest.fixture
+def proc(
+    request: FixtureRequest, sqlite_database: str, mysql_credentials: MySQLCredentials, quiet: bool
+) -> SQLite3toMySQL:
+    return SQLite3toMySQL(  # type: ignore[call-arg]
+        sqlite_file=sqlite_database,
+        mysql_user=mysql_credentials.user,
+        mysql_password=mysql_credentials.password,
+        mysql_host=mysql_credentials.host,
+        mysql_port=mysql_credentials.port,
+        mysql_database=mysql_credentials.database,
+        quiet=quiet,
+        **getattr(request, "param", {}),
+    )
+
+
+@pytest.fixture
+def mock_mysql_connect(mocker: MockerFixture) -> None:
+    mocker.patch.object(mysql.connector, "connect", return_value=mocker.MagicMock(spec=mysql.connector.MySQLConnection))
+    mocker.patch.object(SQLite3toMySQL, "_get_mysql_version", return_value="8.0.30")
+
+
+@pytest.fixture
+def proc_no_mysql(mock_mysql_connect: None, proc: SQLite3toMySQL) -> SQLite3toMySQL:
+    return proc
+
+
 @pytest.mark.usefixtures("sqlite_database", "mysql_instance")
 class TestSQLite3toMySQL:
     @pytest.mark.parametrize("quiet", [False, True])
     def test_translate_type_from_sqlite_to_mysql_invalid_column_type(
         self,
-        sqlite_database: str,
-        mysql_database: Engine,
-        mysql_credentials: MySQLCredentials,
+        proc: SQLite3toMySQL,
         mocker: MockerFixture,
         quiet: bool,
     ) -> None:
-        proc: SQLite3toMySQL = SQLite3toMySQL(  # type: ignore[call-arg]
-            sqlite_file=sqlite_database,
-            mysql_user=mysql_credentials.user,
-            mysql_password=mysql_credentials.password,
-            mysql_host=mysql_credentials.host,
-            mysql_port=mysql_credentials.port,
-            mysql_database=mysql_credentials.database,
-            quiet=quiet,
-        )
         with pytest.raises(ValueError) as excinfo:
             mocker.patch.object(proc, "_valid_column_type", return_value=False)
             proc._translate_type_from_sqlite_to_mysql("text")
         assert "is not a valid column_type!" in str(excinfo.value)
 
     @pytest.mark.parametrize(
-        "mysql_integer_type, mysql_string_type, mysql_text_type",
+        "proc",
         [
-            ("INT(11)", "VARCHAR(300)", "TEXT"),
-            ("BIGINT(19)", "TEXT", "MEDIUMTEXT"),
-            ("BIGINT(19)", "MEDIUMTEXT", "TINYTEXT"),
-            ("BIGINT(20) UNSIGNED", "CHAR(100)", "LONGTEXT"),
+            {"mysql_integer_type": "INT(11)", "mysql_string_type": "VARCHAR(300)", "mysql_text_type": "TEXT"},
+            {"mysql_integer_type": "BIGINT(19)", "mysql_string_type": "TEXT", "mysql_text_type": "MEDIUMTEXT"},
+            {"mysql_integer_type": "BIGINT(19)", "mysql_string_type": "MEDIUMTEXT", "mysql_text_type": "TINYTEXT"},
+            {
+                "mysql_integer_type": "BIGINT(20) UNSIGNED",
+                "mysql_string_type": "CHAR(100)",
+                "mysql_text_type": "LONGTEXT",
+            },
         ],
+        ids=[
+            "INT(11)-VARCHAR(300)-TEXT",
+            "BIGINT(19)-TEXT-MEDIUMTEXT",
+            "BIGINT(19)-MEDIUMTEXT-TINYTEXT",
+            "BIGINT(20) UNSIGNED-CHAR(100)-LONGTEXT",
+        ],
+        indirect=True,
     )
     def test_translate_type_from_sqlite_to_mysql_all_valid_columns(
         self,
-        sqlite_database: str,
-        mysql_database: Engine,
-        mysql_credentials: MySQLCredentials,
+        proc: SQLite3toMySQL,
         faker: Faker,
-        mysql_integer_type: str,
-        mysql_string_type: str,
-        mysql_text_type: str,
     ) -> None:
-        proc: SQLite3toMySQL = SQLite3toMySQL(  # type: ignore
-            sqlite_file=sqlite_database,
-            mysql_user=mysql_credentials.user,
-            mysql_password=mysql_credentials.password,
-            mysql_host=mysql_credentials.host,
-            mysql_port=mysql_credentials.port,
-            mysql_database=mysql_credentials.database,
-            mysql_integer_type=mysql_integer_type,
-            mysql_string_type=mysql_string_type,
-            mysql_text_type=mysql_text_type,
-        )
-
-        for column in sqlite_column_types + ("INT64", "BOOL"):
-            if column in {"Insert", "insert", "dialect"}:
-                continue
-            elif column == "VARCHAR":
-                assert proc._translate_type_from_sqlite_to_mysql(column) == proc._mysql_string_type
-            elif column in {"INTEGER", "INT"}:
-                assert proc._translate_type_from_sqlite_to_mysql(column) == proc._mysql_integer_type
-            elif column in {"INT64", "NUMERIC"}:
-                assert proc._translate_type_from_sqlite_to_mysql(column) == "BIGINT(19)"
-            elif column in {"TINYTEXT", "TEXT", "MEDIUMTEXT", "LONGTEXT"}:
-                assert proc._translate_type_from_sqlite_to_mysql(column) == proc._mysql_text_type
-            elif column in {"BOOL", "BOOLEAN"}:
-                assert proc._translate_type_from_sqlite_to_mysql(column) == "TINYINT(1)"
-            else:
-                assert proc._translate_type_from_sqlite_to_mysql(column) == column
+        char_lengths: t.List[int] = [faker.random_int(1, 99) for _ in range(3)]
+        for column in _FIXED_COLUMN_TYPES:
+            assert proc._translate_type_from_sqlite_to_mysql(column) == column
+        assert proc._translate_type_from_sqlite_to_mysql("INTEGER") == proc._mysql_integer_type
+        for column in ("INT64", "NUMERIC"):
+            assert proc._translate_type_from_sqlite_to_mysql(column) == "BIGINT(19)"
+        for column in ("BOOL", "BOOLEAN"):
+            assert proc._translate_type_from_sqlite_to_mysql(column) == "TINYINT(1)"
         assert proc._translate_type_from_sqlite_to_mysql("TEXT") == proc._mysql_text_type
         assert proc._translate_type_from_sqlite_to_mysql("CLOB") == proc._mysql_text_type
         assert proc._translate_type_from_sqlite_to_mysql("CHARACTER") == "CHAR"
-        length: int = faker.pyint(min_value=1, max_value=99)
-        assert proc._translate_type_from_sqlite_to_mysql(f"CHARACTER({length})") == f"CHAR({length})"
+        assert proc._translate_type_from_sqlite_to_mysql(f"CHARACTER({char_lengths[0]})") == f"CHAR({char_lengths[0]})"
         assert proc._translate_type_from_sqlite_to_mysql("NCHAR") == "CHAR"
-        length = faker.pyint(min_value=1, max_value=99)
-        assert proc._translate_type_from_sqlite_to_mysql(f"NCHAR({length})") == f"CHAR({length})"
+        assert proc._translate_type_from_sqlite_to_mysql(f"NCHAR({char_lengths[1]})") == f"CHAR({char_lengths[1]})"
         assert proc._translate_type_from_sqlite_to_mysql("NATIVE CHARACTER") == "CHAR"
-        length = faker.pyint(min_value=1, max_value=99)
-        assert proc._translate_type_from_sqlite_to_mysql(f"NATIVE CHARACTER({length})") == f"CHAR({length})"
+        assert (
+            proc._translate_type_from_sqlite_to_mysql(f"NATIVE CHARACTER({char_lengths[2]})")
+            == f"CHAR({char_lengths[2]})"
+        )
         assert proc._translate_type_from_sqlite_to_mysql("VARCHAR") == proc._mysql_string_type
-        length = faker.pyint(min_value=1, max_value=255)
-        assert proc._translate_type_from_sqlite_to_mysql(f"VARCHAR({length})") == re.sub(
-            r"\d+", str(length), proc._mysql_string_type
+        length: int = faker.random_int(1, 255)
+        assert proc._translate_type_from_sqlite_to_mysql(f"VARCHAR({length})") == _DIGITS_RE.sub(
+            str(length), proc._mysql_string_type
         )
         assert proc._translate_type_from_sqlite_to_mysql("DOUBLE PRECISION") == "DOUBLE PRECISION"
         assert proc._translate_type_from_sqlite_to_mysql("UNSIGNED BIG INT") == "BIGINT UNSIGNED"
-        length = faker.pyint(min_value=1000000000, max_value=99999999999999999999)
+        length = faker.random_int(10**9, 10**20 - 1)
         assert proc._translate_type_from_sqlite_to_mysql(f"UNSIGNED BIG INT({length})") == f"BIGINT({length}) UNSIGNED"
         assert proc._translate_type_from_sqlite_to_mysql("INT1") == "TINYINT"
         assert proc._translate_type_from_sqlite_to_mysql("INT2") == "SMALLINT"
         assert proc._translate_type_from_sqlite_to_mysql("INT3") == "MEDIUMINT"
         assert proc._translate_type_from_sqlite_to_mysql("INT4") == "INT"
         assert proc._translate_type_from_sqlite_to_mysql("INT8") == "BIGINT"
-        length = faker.pyint(min_value=1, max_value=11)
-        assert proc._translate_type_from_sqlite_to_mysql(f"INT({length})") == re.sub(
-            r"\d+", str(length), proc._mysql_integer_type
+        length = faker.random_int(1, 11)
+        assert proc._translate_type_from_sqlite_to_mysql(f"INT({length})") == _DIGITS_RE.sub(
+            str(length), proc._mysql_integer_type
         )
         for column in {"META", "FOO", "BAR"}:
             assert proc._translate_type_from_sqlite_to_mysql(column) == proc._mysql_string_type
-        precision: int = faker.pyint(min_value=3, max_value=19)
-        scale: int = faker.pyint(min_value=0, max_value=precision - 1)
+        precision: int = faker.random_int(3, 19)
+        scale: int = faker.random_int(0, precision - 1)
         assert (
             proc._translate_type_from_sqlite_to_mysql(f"DECIMAL({precision},{scale})")
             == f"DECIMAL({precision},{scale})"
@@ -207,147 +232,22 @@ class TestSQLite3toMySQL:
     )
     def test_translate_type_from_sqlite_to_mysql_all_valid_numeric_columns_signed_unsigned(
         self,
-        sqlite_database: str,
-        mysql_database: Engine,
-        mysql_credentials: MySQLCredentials,
+        proc: SQLite3toMySQL,
         sqlite_data_type: str,
         mysql_data_type: str,
     ) -> None:
-        proc: SQLite3toMySQL = SQLite3toMySQL(  # type: ignore
-            sqlite_file=sqlite_database,
-            mysql_user=mysql_credentials.user,
-            mysql_password=mysql_credentials.password,
-            mysql_host=mysql_credentials.host,
-            mysql_port=mysql_credentials.port,
-            mysql_database=mysql_credentials.database,
-        )
         assert proc._translate_type_from_sqlite_to_mysql(sqlite_data_type) == mysql_data_type
 
-    @pytest.mark.parametrize("quiet", [False, True])
-    def test_create_database_connection_error(
-        self,
-        sqlite_database: str,
-        mysql_database: Engine,
-        mysql_credentials: MySQLCredentials,
-        mocker: MockerFixture,
-        faker: Faker,
-        caplog: LogCaptureFixture,
-        quiet: bool,
-    ) -> None:
-        proc: SQLite3toMySQL = SQLite3toMySQL(  # type: ignore[call-arg]
-            sqlite_file=sqlite_database,
-            mysql_user=mysql_credentials.user,
-            mysql_password=mysql_credentials.password,
-            mysql_host=mysql_credentials.host,
-            mysql_port=mysql_credentials.port,
-            mysql_database=mysql_credentials.database,
-            quiet=quiet,
-        )
-
-        class FakeCursor:
-            def execute(self, statement: t.Any) -> None:
-                raise mysql.connector.Error(msg="Unknown MySQL error", errno=errorcode.CR_UNKNOWN_ERROR)
-
-        mocker.patch.object(proc, "_mysql_cur", FakeCursor())
-
-        with pytest.raises(mysql.connector.Error) as excinfo:
-            caplog.set_level(logging.DEBUG)
-            proc._create_database()
-        assert str(errorcode.CR_UNKNOWN_ERROR) in str(excinfo.value)
-        assert any(str(errorcode.CR_UNKNOWN_ERROR) in message for message in caplog.messages)
-
-    @pytest.mark.parametrize("quiet", [False, True])
-    def test_create_table_cursor_error(
-        self,
-        sqlite_database: str,
-        mysql_database: Engine,
-        mysql_credentials: MySQLCredentials,
-        mocker: MockerFixture,
-        faker: Faker,
-        caplog: LogCaptureFixture,
-        quiet: bool,
-    ) -> None:
-        proc = SQLite3toMySQL(  # type: ignore[call-arg]
-            sqlite_file=sqlite_database,
-            mysql_user=mysql_credentials.user,
-            mysql_password=mysql_credentials.password,
-            mysql_host=mysql_credentials.host,
-            mysql_port=mysql_credentials.port,
-            mysql_database=mysql_credentials.database,
-            quiet=quiet,
-        )
-
-        class FakeCursor:
-            def execute(self, statement):
-                raise mysql.connector.Error(msg="Unknown MySQL error", errno=errorcode.CR_UNKNOWN_ERROR)
-
-        mocker.patch.object(proc, "_mysql_cur", FakeCursor())
-
-        sqlite_engine: Engine = create_engine(f"sqlite:///{sqlite_database}")
-        sqlite_inspect: Inspector = inspect(sqlite_engine)
-        sqlite_tables: t.List[str] = sqlite_inspect.get_table_names()
-
-        with pytest.raises(mysql.connector.Error) as excinfo:
-            caplog.set_level(logging.DEBUG)
-            proc._create_table(choice(sqlite_tables))
-        assert str(errorcode.CR_UNKNOWN_ERROR) in str(excinfo.value)
-        assert any(str(errorcode.CR_UNKNOWN_ERROR) in message for message in caplog.messages)
-
-        sqlite_engine.dispose()
-
-    @pytest.mark.parametrize("quiet", [False, True])
-    def test_process_cursor_error(
-        self,
-        sqlite_database: str,
-        mysql_database: Engine,
-        mysql_credentials: MySQLCredentials,
-        mocker: MockerFixture,
-        faker: Faker,
-        caplog: LogCaptureFixture,
-        quiet: bool,
-    ) -> None:
-        proc = SQLite3toMySQL(  # type: ignore[call-arg]
-            sqlite_file=sqlite_database,
-            mysql_user=mysql_credentials.user,
-            mysql_password=mysql_credentials.password,
-            mysql_host=mysql_credentials.host,
-            mysql_port=mysql_credentials.port,
-            mysql_database=mysql_credentials.database,
-            quiet=quiet,
-        )
-
-        def fake_transfer_table_data(sql, total_records=0):
-            raise mysql.connector.Error(msg="Unknown MySQL error", errno=errorcode.CR_UNKNOWN_ERROR)
-
-        mocker.patch.object(proc, "_transfer_table_data", fake_transfer_table_data)
-
-        with pytest.raises(mysql.connector.Error) as excinfo:
-            caplog.set_level(logging.DEBUG)
-            proc.transfer()
-        assert str(errorcode.CR_UNKNOWN_ERROR) in str(excinfo.value)
-        assert any(str(errorcode.CR_UNKNOWN_ERROR) in message for message in caplog.messages)
-
     @pytest.mark.parametrize("quiet", [False, True])
     def test_add_indices_error(
         self,
         sqlite_database: str,
         mysql_database: Engine,
-        mysql_credentials: MySQLCredentials,
+        proc: SQLite3toMySQL,
         mocker: MockerFixture,
-        faker: Faker,
         caplog: LogCaptureFixture,
         quiet: bool,
     ) -> None:
-        proc = SQLite3toMySQL(  # type: ignore[call-arg]
-            sqlite_file=sqlite_database,
-            mysql_user=mysql_credentials.user,
-            mysql_password=mysql_credentials.password,
-            mysql_host=mysql_credentials.host,
-            mysql_port=mysql_credentials.port,
-            mysql_database=mysql_credentials.database,
-            quiet=quiet,
-        )
-
         sqlite_engine: Engine = create_engine(f"sqlite:///{sqlite_database}")
         sqlite_inspect: Inspector = inspect(sqlite_engine)
         sqlite_tables: t.List[str] = sqlite_inspect.get_table_names()
@@ -357,20 +257,17 @@ class TestSQLite3toMySQL:
             if sqlite_inspect.get_indexes(table):
                 tables_with_indices.append(table)
 
-        table_name: str = choice(tables_with_indices)
+        table_name: str = tables_with_indices[0]
         proc._create_table(table_name)
 
-        class FakeCursor:
-            def execute(self, statement):
-                raise mysql.connector.Error(msg="Unknown MySQL error", errno=errorcode.CR_UNKNOWN_ERROR)
-
         mocker.patch.object(proc, "_mysql_cur", FakeCursor())
 
         with pytest.raises(mysql.connector.Error) as excinfo:
             caplog.set_level(logging.DEBUG)
             proc._add_indices(table_name)
-        assert str(errorcode.CR_UNKNOWN_ERROR) in str(excinfo.value)
-        assert any(str(errorcode.CR_UNKNOWN_ERROR) in message for message in caplog.messages)
+        error_code: str = str(errorcode.CR_UNKNOWN_ERROR)
+        assert error_code in str(excinfo.value)
+        assert any(error_code in record.getMessage() for record in caplog.records)
 
         sqlite_engine.dispose()
 
@@ -379,22 +276,11 @@ class TestSQLite3toMySQL:
         self,
         sqlite_database: str,
         mysql_database: Engine,
-        mysql_credentials: MySQLCredentials,
+        proc: SQLite3toMySQL,
         mocker: MockFixture,
-        faker: Faker,
         caplog: LogCaptureFixture,
         quiet: bool,
     ) -> None:
-        proc = SQLite3toMySQL(  # type: ignore[call-arg]
-            sqlite_file=sqlite_database,
-            mysql_user=mysql_credentials.user,
-            mysql_password=mysql_credentials.password,
-            mysql_host=mysql_credentials.host,
-            mysql_port=mysql_credentials.port,
-            mysql_database=mysql_credentials.database,
-            quiet=quiet,
-        )
-
         sqlite_engine: Engine = create_engine(f"sqlite:///{sqlite_database}")
         sqlite_inspect: Inspector = inspect(sqlite_engine)
         sqlite_cnx: Connection = sqlite_engine.connect()
@@ -410,21 +296,65 @@ class TestSQLite3toMySQL:
                     tables_with_foreign_keys.append(table)
                     break
 
-        table_name: str = choice(tables_with_foreign_keys)
+        table_name: str = tables_with_foreign_keys[0]
 
         proc._create_table(table_name)
 
-        class FakeCursor:
-            def execute(self, statement):
-                raise mysql.connector.Error(msg="Unknown MySQL error", errno=errorcode.CR_UNKNOWN_ERROR)
-
         mocker.patch.object(proc, "_mysql_cur", FakeCursor())
 
         with pytest.raises(mysql.connector.Error) as excinfo:
             caplog.set_level(logging.DEBUG)
             proc._add_foreign_keys(table_name)
-        assert str(errorcode.CR_UNKNOWN_ERROR) in str(excinfo.value)
-        assert any(str(errorcode.CR_UNKNOWN_ERROR) in message for message in caplog.messages)
+        error_code: str = str(errorcode.CR_UNKNOWN_ERROR)
+        assert error_code in str(excinfo.value)
+        assert any(error_code in record.getMessage() for record in caplog.records)
 
         sqlite_cnx.close()
         sqlite_engine.dispose()
+
+
+@pytest.mark.usefixtures("sqlite_database")
+class TestSQLite3toMySQLWithoutMySQL:
+    @pytest.mark.parametrize(
+        "patch_attr, patch_value, trigger",
+        [
+            pytest.param(
+                "_mysql_cur",
+                FakeCursor(),
+                lambda proc, tables: proc._create_database(),
+                id="create_database",
+            ),
+            pytest.param(
+                "_mysql_cur",
+                FakeCursor(),
+                lambda proc, tables: proc._create_table(tables[0]),
+                id="create_table",
+            ),
+            pytest.param(
+                "_transfer_table_data",
+                _fake_transfer_table_data,
+                lambda proc, tables: proc.transfer(),
+                id="transfer",
+            ),
+        ],
+    )
+    @pytest.mark.parametrize("quiet", [False, True])
+    def test_cursor_error(
+        self,
+        proc_no_mysql: SQLite3toMySQL,
+        mocker: MockerFixture,
+        caplog: LogCaptureFixture,
+        sqlite_table_names: t.List[str],
+        quiet: bool,
+        patch_attr: str,
+        patch_value: t.Any,
+        trigger: t.Callable[[SQLite3toMySQL, t.List[str]], None],
+    ) -> None:
+        mocker.patch.object(proc_no_mysql, patch_attr, patch_value)
+
+        with pytest.raises(mysql.connector.Error) as excinfo:
+            caplog.set_level(logging.DEBUG)
+            trigger(proc_no_mysql, sqlite_table_names)
+        error_code: str = str(errorcode.CR_UNKNOWN_ERROR)
+        assert error_code in str(excinfo.value)
+        assert any(error_code in record.getMessage() for record in caplog.records)